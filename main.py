@@ -1,15 +1,45 @@
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
-import matplotlib.animation as animation
+import matplotlib
 import json 
 import sys
+import queue
+import threading
+import time
 
 # --- IMPORT MODULES ---
 from modules.signal_generator import SignalGenerator
-from modules.alarm_logic import AlarmSystem
+from modules.alarm_logic import AlarmSystem, ALARM_STATES, HIGH_ALARM_STATE, LOW_ALARM_STATE
 from modules.data_logger import DataLogger
 from modules.ui_builder import UIBuilder 
+from modules.window_stats import WindowStats
+from modules.history_buffer import HistoryBuffer
+from modules.kernels import scada_step
+
+# Let Agg merge near-collinear segments of the streaming lines before rasterizing
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+})
+
+TIME_STEP = 0.1             # Simulated seconds per frame
+RESCALE_INTERVAL_MS = 1000  # How often the (non-blitted) axis limits/ticks are refreshed
+AXIS_LIMIT_TOLERANCE = 0.01 # y-limit moves smaller than 1% of the span are not applied
+LOG_BATCH_SIZE = 50         # CSV rows collected in memory before one batched write
+STATS_EVERY_N_FRAMES = 5    # Stats labels refresh on every 5th frame (readable rate)
+LABEL_FLUSH_MS = 100        # Label text reaches Tk at most 10 times per second
+PARAM_DEBOUNCE_MS = 50      # Quiet time after the last slider event before applying it
+SAMPLE_QUEUE_SIZE = 1024    # Samples the producer may get ahead of the GUI before dropping
+HIDDEN_TICK_MS = 1000       # Tick period while the window is unmapped (only drains and logs)
+
+# Per-frame label templates (%-formatting goes straight to C, no format-spec parsing)
+TEMP_LABEL = "Temp: %.2f °C"
+MOTOR_LABEL = ("Motor: OFF", "Motor: ON")
+STAT_MAX_LABEL = "MAX: %.2f °C"
+STAT_MIN_LABEL = "MIN: %.2f °C"
+STAT_AVG_LABEL = "AVG: %.2f °C"
 
 class IndustrialDashboard:
     def __init__(self, root):
@@ -32,30 +62,55 @@ class IndustrialDashboard:
         self.simulation_time = 0.0
         self.history_len = self.config["history_length"]
         self.manual_override_active = False 
+        self.manual_mode = False    # Mirror of chk_manual_var readable from the producer thread
+        self.latest_time = 0.0      # Simulation time of the newest sample shown on screen
+        self._log_buffer = []       # Rows waiting for the next batched CSV write
+        self._last_ui = {}          # Last options pushed to each label (skip no-op Tk calls)
+        self._pending_labels = {}   # label key -> newest text not written to its StringVar yet
+        self._shown_labels = {}     # label key -> text its StringVar currently holds
+        self._labels_flushed_at = 0.0
+        self._stats_tick = 0        # Frame counter for the throttled stats labels
+        self._axis_limits = None    # (y_min, y_max) last applied to the analog plot
+        self._time_origin = 0.0     # Simulation time at x = 0, used by the tick labels
+        self._param_after_id = None # Pending debounced slider update
+        self._after_id = None       # Pending animation tick (only scheduled while running)
+        self._rescale_after_id = None # Pending axis rescale (only scheduled while running)
+        self._hidden = False        # True between the root window's <Unmap> and <Map>
         
-        # Data Buffers
-        self.x_data = []
-        self.y_analog = []
-        self.y_digital = []
-        
-        # Lines Buffers
-        self.line_high_data = []    # Buffer for High Alarm
-        self.line_low_data = []     # Buffer for Low Alarm
-        self.line_base_data = []    # Buffer for Baseline
+        # Data Buffers (preallocated arrays, one row per plotted channel):
+        # process value, motor state (the limit/baseline lines are constants, not buffered)
+        self.history = HistoryBuffer(self.history_len, ("analog", "digital"))
+        # Fixed x positions of the history slots; the samples scroll across them
+        self.x_grid = np.arange(self.history_len) * TIME_STEP
+
+        # Running MAX/MIN/AVG over the same window as the plot
+        self.analog_stats = WindowStats(self.history_len)
 
         # --- BUILD GUI ---
         self.ui = UIBuilder(self, self.root)
         self.ui.build_all()
         
         # --- ANIMATION CONFIG ---
-        self.ani = animation.FuncAnimation(
-            self.fig, 
-            self.update_process, 
-            interval=self.config["refresh_rate_ms"], 
-            blit=False, 
-            cache_frame_data=False 
-        )
+        # Blitting (see UIBuilder.update_plots): the first full draw caches
+        # the static axes backgrounds, each tick only paints the moving lines.
+        self.ui.prime_blit()
+        # The tick and rescale timers are started by toggle_simulation, so a
+        # paused dashboard schedules no work at all.
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Minimizing slows the tick down instead of repainting nothing at full rate
+        self.root.bind("<Unmap>", lambda event: self._on_map_change(event, True))
+        self.root.bind("<Map>", lambda event: self._on_map_change(event, False))
+
+        # --- SIGNAL PRODUCER ---
+        # Generation and alarm checks run on a worker thread at the refresh rate
+        # and hand samples over through a bounded queue; the Tk loop only drains
+        # it, so a slow frame delays the drawing, not the simulation.
+        self._samples = queue.Queue(maxsize=SAMPLE_QUEUE_SIZE)
+        self._sim_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._run_event = threading.Event()   # Set while running; the producer sleeps on it
+        self._producer = threading.Thread(target=self._produce, daemon=True)
+        self._producer.start()
 
     def load_config(self):
         """Loads settings from config.json or uses defaults."""
@@ -69,37 +124,141 @@ class IndustrialDashboard:
                 "alarm_low": 0.0,   # [UPDATED] Low threshold default is 0.0
                 "log_file": "data/default_log.csv",
                 "history_length": 100,
-                "refresh_rate_ms": 200
+                "refresh_rate_ms": 200,
+                "plot_backend": "matplotlib"
             }
 
     def toggle_simulation(self):
         self.is_running = not self.is_running
         if self.is_running:
+            self._run_event.set()
+            self._start_loops()
             self.btn_start.config(text="PAUSE SIMULATION")
-            self.lbl_status.config(text="RUNNING", bg="#007acc")
+            self.set_widget("status", self.lbl_status, text="RUNNING", style="StatusRun.TLabel")
         else:
+            self._run_event.clear()
+            self._stop_loops()
+            # Show whatever was produced right before the pause
+            self._consume_samples()
+            self.flush_labels(force=True)
             self.btn_start.config(text="RESUME SIMULATION")
-            self.lbl_status.config(text="PAUSED", bg="gray")
+            self.set_widget("status", self.lbl_status, text="PAUSED", style="StatusIdle.TLabel")
+
+    def _start_loops(self):
+        """Schedules the animation tick and the (slower) axis rescale."""
+        self._after_id = self.root.after(self._tick_interval(), self._tick)
+        # Axis limits live in the cached blit background, so they are
+        # rescaled on a slower timer instead of on every frame.
+        self._rescale_after_id = self.root.after(RESCALE_INTERVAL_MS, self._rescale_axes)
+        self.ui.set_plots_running(True)
+
+    def _stop_loops(self):
+        """Cancels the timers so nothing wakes up while paused."""
+        for after_id in (self._after_id, self._rescale_after_id):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self._after_id = self._rescale_after_id = None
+        self.ui.set_plots_running(False)
+
+    def _tick_interval(self):
+        return HIDDEN_TICK_MS if self._hidden else self.config["refresh_rate_ms"]
+
+    def _on_map_change(self, event, hidden):
+        """Re-arms the timers at the hidden/visible tick rate when the window (un)maps."""
+        # Child widgets' events propagate to the root's bindings too; a separate
+        # plot window (pyqtgraph) keeps showing data while the root is minimized
+        if event.widget is not self.root or hidden == self._hidden or not self.ui.plots_in_root():
+            return
+        self._hidden = hidden
+        if self.is_running:
+            self._stop_loops()
+            self._start_loops()
+
+    def set_widget(self, key, widget, **options):
+        """Configures a widget only if it doesn't already show these options."""
+        if self._last_ui.get(key) != options:
+            widget.config(**options)
+            self._last_ui[key] = options
+
+    def set_label(self, key, text):
+        """Queues text for one of the StringVar labels (see flush_labels)."""
+        self._pending_labels[key] = text
+
+    def flush_labels(self, force=False):
+        """
+        Writes the queued label text, at most once per LABEL_FLUSH_MS unless
+        forced, and only to StringVars whose text actually changed.
+        """
+        now = time.monotonic()
+        if not force and now - self._labels_flushed_at < LABEL_FLUSH_MS / 1000.0:
+            return
+        self._labels_flushed_at = now
+        label_vars, shown = self.label_vars, self._shown_labels
+        for key, text in self._pending_labels.items():
+            if shown.get(key) != text:
+                label_vars[key].set(text)
+                shown[key] = text
+        self._pending_labels.clear()
 
     def toggle_logging(self):
         self.is_logging = self.chk_log_var.get()
+        if not self.is_logging:
+            self.flush_log_buffer()
+
+    def write_log_buffer(self):
+        """Writes the pending CSV rows in one batch (the logger flushes every few batches)."""
+        if self._log_buffer:
+            self.logger.log_rows(self._log_buffer)
+            self._log_buffer.clear()
 
-    def change_signal_type(self, event):
-        new_type = self.combo_type.get()
-        self.generator.set_signal_type(new_type)
+    def flush_log_buffer(self):
+        """Writes the pending CSV rows and pushes them to disk right away."""
+        self.write_log_buffer()
+        self.logger.flush()
+
+    def change_signal_type(self, *_):
+        """var_signal write trace (Tk passes the variable name, index and mode)."""
+        new_type = self.var_signal.get()
+        # Re-selecting the current entry also writes the variable
+        if new_type != self.generator.signal_type:
+            # The producer reads generator.table under the same lock
+            with self._sim_lock:
+                self.generator.set_signal_type(new_type)
 
     def update_params(self, _=None):
+        """
+        Slider callback. A drag fires this for every pixel, so the actual update is
+        debounced: each call re-arms a short timer and only the last one applies.
+        """
+        if self._param_after_id is not None:
+            self.root.after_cancel(self._param_after_id)
+        self._param_after_id = self.root.after(PARAM_DEBOUNCE_MS, self._apply_params)
+
+    def _apply_params(self):
+        self._param_after_id = None
         if not hasattr(self, 'slider_amp') or not hasattr(self, 'slider_freq'):
             return
         try:
             new_amp = float(self.slider_amp.get())
             new_freq = float(self.slider_freq.get())
-            self.generator.update_params(amp=new_amp, freq=new_freq)
+            with self._sim_lock:
+                self.generator.update_params(amp=new_amp, freq=new_freq)
         except ValueError:
             pass
 
+    def set_alarm_thresholds(self, high, low):
+        """
+        Changes the alarm limits and moves their (static) plot lines. The lines
+        are part of the blit background, so one redraw re-caches it.
+        """
+        with self._sim_lock:
+            self.alarm_system.set_thresholds(high, low)
+        self.ui.set_limit_lines(high, low)
+        self.ui.schedule_redraw()
+
     def toggle_manual_ui(self):
-        if self.chk_manual_var.get():
+        self.manual_mode = self.chk_manual_var.get()
+        if self.manual_mode:
             self.btn_manual_toggle.config(state="normal", bg="#f1c40f", text="FORCE MOTOR: OFF")
             self.manual_override_active = False 
         else:
@@ -112,136 +271,209 @@ class IndustrialDashboard:
         else:
             self.btn_manual_toggle.config(text="FORCE MOTOR: OFF", bg="#e74c3c")
 
-    def update_process(self, frame):
-        if not self.is_running:
-            return
+    def _produce(self):
+        """Worker thread: steps the simulation at the refresh rate while running."""
+        period = self.config["refresh_rate_ms"] / 1000.0
+        while not self._stop_event.is_set():
+            # Blocks without any wake-ups while the simulation is paused
+            self._run_event.wait()
+            if self._stop_event.wait(period):
+                break
+            # Check, step and enqueue under the lock: reset_simulation clears
+            # is_running before draining the queue under the same lock, so no
+            # pre-reset sample can be queued after that drain
+            with self._sim_lock:
+                if not self.is_running:
+                    continue
+                try:
+                    self._samples.put_nowait(self.simulation_step())
+                except queue.Full:
+                    pass  # GUI stalled for minutes; drop rather than block the producer
 
+    def simulation_step(self):
+        """
+        Advances the simulation by one time step (producer thread).
+        Returns (time, wall_time, analog_val, digital_val, status_msg, status_color).
+        """
         # 1. Update Time
-        self.simulation_time += 0.1 
+        self.simulation_time += TIME_STEP
 
-        # 2. Get Data
-        analog_val = self.generator.get_analog_value(self.simulation_time)
-        
+        # 2. Get Data and 3. Check Alarms, fused into one compiled call
+        generator, alarm_system = self.generator, self.alarm_system
         # Threshold logic for Motor (Center = 20.0)
-        threshold_motor = self.generator.offset # Should be 20.0
+        threshold_motor = generator.offset # Should be 20.0
+        analog_val, digital_val, state_index = scada_step(
+            generator.advance_phase(TIME_STEP), generator.table,
+            float(generator.offset), generator.sample_noise(), float(threshold_motor),
+            float(alarm_system.high_limit), float(alarm_system.low_limit)
+        )
         
-        if self.chk_manual_var.get():
+        if self.manual_mode:
             digital_val = 1 if self.manual_override_active else 0
-        else:
-            # Fix: Typo corrected here
-            digital_val = self.generator.get_digital_value(analog_val, threshold=threshold_motor)
 
-        # 3. Check Alarms
-        is_alarm, status_msg, status_color = self.alarm_system.check_status(analog_val)
-        
-        # Update UI Labels
-        self.lbl_status.config(text=status_msg, bg=status_color)
-        self.lbl_val_analog.config(text=f"Temp: {analog_val:.2f} °C")
-        state_text = "ON" if digital_val else "OFF"
-        self.lbl_val_digital.config(text=f"Motor: {state_text}")
+        is_alarm, status_msg, status_color = ALARM_STATES[state_index]
+        # The kernel replaces AlarmSystem.check_status, so keep its flag current
+        alarm_system.alarm_triggered = is_alarm
+        # Wall-clock time of acquisition; the CSV row is formatted later, on the Tk thread
+        return self.simulation_time, time.time(), analog_val, digital_val, status_msg, status_color
 
-        # 4. Data Logging
-        if self.is_logging:
-            self.logger.log_step(self.simulation_time, analog_val, digital_val, status_msg)
+    def _drain_samples(self):
+        """Takes every sample the producer queued since the last tick."""
+        samples = []
+        while True:
+            try:
+                samples.append(self._samples.get_nowait())
+            except queue.Empty:
+                return samples
 
-        # 5. Update Buffers (Including new lines)
-        self.x_data.append(self.simulation_time)
-        self.y_analog.append(analog_val)
-        self.y_digital.append(digital_val)
-        
-        # Add values for the 3 constant lines
-        self.line_high_data.append(self.alarm_system.high_limit)
-        self.line_low_data.append(self.alarm_system.low_limit)
-        self.line_base_data.append(self.generator.offset) # 20.0
-        
-        # Manage History Length
-        if len(self.x_data) > self.history_len:
-            self.x_data.pop(0)
-            self.y_analog.pop(0)
-            self.y_digital.pop(0)
-            self.line_high_data.pop(0)
-            self.line_low_data.pop(0)
-            self.line_base_data.pop(0)
-
-        # 6. Update Stats
-        if len(self.y_analog) > 0:
-            self.lbl_stat_max.config(text=f"MAX: {np.max(self.y_analog):.2f} °C")
-            self.lbl_stat_min.config(text=f"MIN: {np.min(self.y_analog):.2f} °C")
-            self.lbl_stat_avg.config(text=f"AVG: {np.mean(self.y_analog):.2f} °C")
-
-        # 7. Update Graph Lines (All 4 lines on top graph)
-        self.line_analog.set_data(self.x_data, self.y_analog)
-        self.line_alarm_limit.set_data(self.x_data, self.line_high_data)
-        self.line_alarm_low.set_data(self.x_data, self.line_low_data)
-        self.line_baseline.set_data(self.x_data, self.line_base_data)
-        
-        self.line_digital.set_data(self.x_data, self.y_digital)
+    def _tick(self):
+        """Animation loop driven by Tk while running."""
+        self._after_id = self.root.after(self._tick_interval(), self._tick)
+        self._consume_samples()
+
+    def _consume_samples(self):
+        """Shows the samples queued since the last call, then blits."""
+        samples = self._drain_samples()
+        if samples and self.update_process(samples):
+            self.ui.update_plots()
+
+    def is_visible(self):
+        """False while the plots are minimized or not mapped on screen."""
+        return self.ui.plots_visible()
+
+    def update_process(self, samples):
+        """
+        Logs and buffers a batch of samples, then refreshes the plots and HMI once.
+        Returns False (display untouched) while the window is not visible.
+        """
+        # 4. Data Logging and Buffers, for every sample of the batch
+        for sample_time, wall_time, analog_val, digital_val, status_msg, _ in samples:
+            if self.is_logging:
+                self._log_buffer.append(self.logger.format_row(sample_time, wall_time, analog_val, digital_val, status_msg))
+
+            # 5. Update Buffers (ring buffer, the oldest sample is overwritten)
+            self.history.append(analog_val, digital_val)
+            self.analog_stats.push(analog_val)
+        if len(self._log_buffer) >= LOG_BATCH_SIZE:
+            self.write_log_buffer()
+
+        # The newest sample is still recorded for when the window comes back
+        self.latest_time = samples[-1][0]
+        if not self.is_visible():
+            return False
+
+        # Update UI Labels (the display shows the newest sample)
+        _, _, analog_val, digital_val, status_msg, status_color = samples[-1]
+        self.set_widget("status", self.lbl_status, text=status_msg, style=self.ui.status_styles[status_color])
+        self.set_label("analog", TEMP_LABEL % analog_val)
+        self.set_label("digital", MOTOR_LABEL[1 if digital_val else 0])
+
+        # 6. Update Stats (throttled, nobody reads them at the full frame rate)
+        self._stats_tick = (self._stats_tick + 1) % STATS_EVERY_N_FRAMES
+        if self._stats_tick == 0 and len(self.analog_stats) > 0:
+            # Formatting to 2 decimals first means sub-hundredth jitter never repaints
+            self.set_label("stat_max", STAT_MAX_LABEL % self.analog_stats.maximum)
+            self.set_label("stat_min", STAT_MIN_LABEL % self.analog_stats.minimum)
+            self.set_label("stat_avg", STAT_AVG_LABEL % self.analog_stats.mean)
+        self.flush_labels()
+
+        # 7. Update Graph Lines (limit and baseline lines are static, not redrawn here)
+        self.ui.set_plot_data(self.history.view("analog"), self.history.view("digital"))
         
-        # 8. Scale Axes
-        if len(self.x_data) > 1:
-            self.ax1.set_xlim(min(self.x_data), max(self.x_data))
-            self.ax2.set_xlim(min(self.x_data), max(self.x_data))
+        # 8. HMI Animation (canvas items are mutated in place, only on change)
+        self.ui.set_motor_state(digital_val > 0.5)
+
+        # Messages are the prebuilt ALARM_STATES strings, so identity is enough
+        if status_msg is HIGH_ALARM_STATE[1]:
+            liquid_color = "#e74c3c"
+        elif status_msg is LOW_ALARM_STATE[1]:
+            liquid_color = "#e67e22" # Orange for low
+        else:
+            liquid_color = "#3498db"
+        self.ui.set_liquid_level(analog_val, liquid_color)
+        return True
+
+    def _rescale_axes(self):
+        """
+        Refreshes the time tick labels and fits the y-axis, at most once per
+        RESCALE_INTERVAL_MS. Triggers a full redraw so the blit background
+        picks up the new ticks.
+        """
+        if len(self.history) > 1 and self.is_visible():
+            # The newest sample sits at the right end of the fixed x-grid
+            self._time_origin = self.latest_time - self.x_grid[-1]
             
-            y_min, y_max = min(self.y_analog), max(self.y_analog)
+            # Extremes come from the running window stats, no rescan needed
+            y_min, y_max = self.analog_stats.minimum, self.analog_stats.maximum
             padding = (y_max - y_min) * 0.2
             if padding < 5: padding = 5
-            self.ax1.set_ylim(y_min - padding, y_max + padding)
             
-            self.ax2.set_ylim(-0.5, 1.5)
-
-        # 9. HMI Animation
-        color_motor = "#2ecc71" if digital_val > 0.5 else "#95a5a6"
-        self.canvas_hmi.itemconfig(self.motor_id, fill=color_motor)
-
-        safe_analog = max(0, min(analog_val, 40)) 
-        fill_ratio = safe_analog / 40.0
-        fill_height = fill_ratio * 98 
-        new_top_y = 128 - fill_height
-        self.canvas_hmi.coords(self.liquid_id, 32, new_top_y, 88, 128)
-
-        if "CRITICAL" in status_msg:
-            self.canvas_hmi.itemconfig(self.liquid_id, fill="#e74c3c")
-        elif "WARNING" in status_msg:
-            self.canvas_hmi.itemconfig(self.liquid_id, fill="#e67e22") # Orange for low
-        else:
-            self.canvas_hmi.itemconfig(self.liquid_id, fill="#3498db")
+            limits = (y_min - padding, y_max + padding)
+            # set_ylim invalidates the whole axes and re-ticks it, so skip
+            # limits that moved by less than AXIS_LIMIT_TOLERANCE of the span
+            if self._limits_changed(limits):
+                self._axis_limits = limits
+                self.ui.set_analog_ylim(*limits)
+            self.ui.schedule_redraw()
 
-        # Must return all lines that are animated
-        return self.line_analog, self.line_digital, self.line_alarm_limit, self.line_alarm_low, self.line_baseline
+        self._rescale_after_id = self.root.after(RESCALE_INTERVAL_MS, self._rescale_axes)
     
+    def _limits_changed(self, limits):
+        if self._axis_limits is None:
+            return True
+        tolerance = (limits[1] - limits[0]) * AXIS_LIMIT_TOLERANCE
+        return (abs(limits[0] - self._axis_limits[0]) > tolerance
+                or abs(limits[1] - self._axis_limits[1]) > tolerance)
+
+    def format_time_tick(self, x, _pos=None):
+        """Maps a fixed x-grid position to the simulation time shown there."""
+        t = self._time_origin + x
+        return f"{t:.1f}" if t >= 0 else ""
+
     def on_close(self):
         print("Closing application...")
         self.is_running = False
-        if self.ani.event_source:
-            self.ani.event_source.stop()
+        self._stop_event.set()
+        self._run_event.set()   # Wake the producer so it can see the stop request
+        self._producer.join(timeout=1.0)
+        self._stop_loops()
+        self.flush_log_buffer()
+        self.logger.close()
         self.root.destroy()
         self.root.quit()
         sys.exit(0)
     
     def reset_simulation(self):
         print("System Reset.")
-        self.simulation_time = 0.0
-        self.x_data.clear()
-        self.y_analog.clear()
-        self.y_digital.clear()
-        
-        self.line_high_data.clear()
-        self.line_low_data.clear()
-        self.line_base_data.clear()
-
-        self.line_analog.set_data([], [])
-        self.line_digital.set_data([], [])
-        self.line_alarm_limit.set_data([], [])
-        self.line_alarm_low.set_data([], [])
-        self.line_baseline.set_data([], [])
+        # Reset stops the simulation until the user presses start again
+        if self.is_running:
+            self.is_running = False
+            self._run_event.clear()
+            self._stop_loops()
+        self.btn_start.config(text="START SIMULATION")
+        self.set_widget("status", self.lbl_status, text="IDLE", style="StatusIdle.TLabel")
+        with self._sim_lock:
+            self.simulation_time = 0.0
+            self.generator.reset_phase()
+            # Samples generated before the reset must not reach the new history
+            self._drain_samples()
+        self.latest_time = 0.0
+        self.history.clear()
+        self.analog_stats.reset()
+        self._stats_tick = 0
+
+        self._time_origin = 0.0
+        self.ui.set_plot_data(self.history.view("analog"), self.history.view("digital"))
         
-        self.lbl_stat_max.config(text="MAX: 0.00")
-        self.lbl_stat_min.config(text="MIN: 0.00")
-        self.lbl_stat_avg.config(text="AVG: 0.00")
+        self.set_label("stat_max", "MAX: 0.00")
+        self.set_label("stat_min", "MIN: 0.00")
+        self.set_label("stat_avg", "AVG: 0.00")
+        self.flush_labels(force=True)
 
-        self.canvas.draw()
+        self.ui.schedule_redraw()
 
         if self.is_logging:
+            self.flush_log_buffer()
             self.logger.log_step(0, 0, 0, "SYSTEM RESET")
 
 if __name__ == "__main__":
@@ -1,3 +1,12 @@
+# Prebuilt (is_alarm_active, status_message, color_code) results, so a check
+# never allocates. Indexed by (value >= high) + 2 * (value <= low); index 3
+# (both limits crossed, i.e. misconfigured limits) resolves to the high alarm.
+NORMAL_STATE = (False, "SYSTEM NORMAL", "green")
+HIGH_ALARM_STATE = (True, "CRITICAL: HIGH TEMP", "red")
+LOW_ALARM_STATE = (True, "WARNING: LOW TEMP", "orange")
+
+ALARM_STATES = (NORMAL_STATE, HIGH_ALARM_STATE, LOW_ALARM_STATE, HIGH_ALARM_STATE)
+
 class AlarmSystem:
     """
     Logic unit for monitoring safety thresholds.
@@ -13,19 +22,11 @@ class AlarmSystem:
         Evaluates the current analog value against thresholds.
         Returns a tuple: (is_alarm_active, status_message, color_code)
         """
-        if current_value >= self.high_limit:
-            self.alarm_triggered = True
-            return (True, "CRITICAL: HIGH TEMP", "red")
-        
-        elif current_value <= self.low_limit:
-            self.alarm_triggered = True
-            return (True, "WARNING: LOW TEMP", "orange")
-        
-        else:
-            self.alarm_triggered = False
-            return (False, "SYSTEM NORMAL", "green")
+        state = ALARM_STATES[(current_value >= self.high_limit) + 2 * (current_value <= self.low_limit)]
+        self.alarm_triggered = state[0]
+        return state
 
     def set_thresholds(self, high, low):
         """Updates thresholds dynamically from the GUI."""
         self.high_limit = high
-        self.low_limit = low
\ No newline at end of file
+        self.low_limit = low
@@ -0,0 +1,170 @@
+import math
+import tkinter as tk
+import numpy as np
+
+ANALOG_COLOR = "#007acc"
+DIGITAL_COLOR = "#2ca02c"
+GRID_COLOR = "#cccccc"
+DIGITAL_YLIM = (-0.5, 1.5)
+LIMIT_DASHES = {"dashed": (6, 3), "dotted": (1, 3)}
+
+def nice_ticks(low, high, count=5):
+    """Round tick values (steps of 1, 2 or 5 x 10^n) covering low..high."""
+    span = high - low
+    if span <= 0:
+        return [low]
+    raw_step = span / count
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    for factor in (1, 2, 5, 10):
+        step = factor * magnitude
+        if step >= raw_step:
+            break
+    first = math.ceil(low / step) * step
+    return [first + i * step for i in range(int((high - first) / step) + 1)]
+
+class CanvasPlot:
+    """
+    Lightweight replacement for the Matplotlib figure, drawn on one tk.Canvas.
+    The analog and digital traces are two polylines whose coords() are replaced
+    per frame; the x positions of the fixed time grid are computed once per
+    resize. Frames, grid, titles, tick labels and the limit lines are static
+    items, redrawn only on resize, y-range or tick changes.
+    """
+    MARGIN_LEFT = 60
+    MARGIN_RIGHT = 15
+    MARGIN_TOP = 25
+    MARGIN_BOTTOM = 25
+    GAP = 45                # Between the analog and digital boxes (room for the title)
+    ANALOG_SHARE = 0.75     # Same 3:1 height ratio as the Matplotlib layout
+
+    def __init__(self, parent, x_grid, tick_formatter, font, title_font):
+        self.widget = tk.Canvas(parent, bg="white", highlightthickness=0)
+        self.x_grid = x_grid
+        self.tick_formatter = tick_formatter
+        self.font = font
+        self.title_font = title_font
+        self.ylim = (0.0, 40.0)
+        self.limit_lines = {}       # name -> [value, color, style]
+        self._analog = self._digital = None
+        self._dirty = False
+        self._redraw_id = None
+
+        self.poly_analog = self.widget.create_line(0, 0, 0, 0, fill=ANALOG_COLOR, width=2, state="hidden")
+        self.poly_digital = self.widget.create_line(0, 0, 0, 0, fill=DIGITAL_COLOR, width=3, state="hidden")
+        self._layout(1, 1)     # Real size arrives with the first <Configure>
+        self.widget.bind("<Configure>", self._on_resize)
+
+    # --- Geometry ---
+    def _layout(self, width, height):
+        left, right = self.MARGIN_LEFT, max(width - self.MARGIN_RIGHT, self.MARGIN_LEFT + 1)
+        usable = max(height - self.MARGIN_TOP - self.GAP - self.MARGIN_BOTTOM, 4)
+        analog_height = usable * self.ANALOG_SHARE
+        self.analog_box = (left, self.MARGIN_TOP, right, self.MARGIN_TOP + analog_height)
+        digital_top = self.analog_box[3] + self.GAP
+        self.digital_box = (left, digital_top, right, digital_top + usable - analog_height)
+
+        # The time grid never moves, so its pixel columns are fixed per size
+        x0, x1 = self.x_grid[0], self.x_grid[-1]
+        self._px = left + (self.x_grid - x0) * ((right - left) / (x1 - x0 or 1.0))
+
+    def _on_resize(self, event):
+        self._layout(event.width, event.height)
+        self._dirty = True
+        self.redraw()
+
+    def _to_py(self, values, box, ylim):
+        low, high = ylim
+        return box[1] + (high - values) * ((box[3] - box[1]) / (high - low))
+
+    # --- Data ---
+    def set_data(self, analog, digital):
+        """Stores the newest traces; update() pushes them to the canvas."""
+        self._analog, self._digital = analog, digital
+        self._dirty = True
+
+    def set_ylim(self, low, high):
+        self.ylim = (low, high)
+        self._dirty = True
+
+    def add_limit_line(self, name, value, color, style):
+        """Adds a constant horizontal line ("dashed" or "dotted") to the analog plot."""
+        self.limit_lines[name] = [value, color, style]
+
+    def move_limit_line(self, name, value):
+        """Moves a limit line (takes effect with the next redraw)."""
+        self.limit_lines[name][0] = value
+
+    def update(self):
+        """Replaces the polyline coordinates with the stored traces."""
+        if not self._dirty or self._analog is None:
+            return
+        self._dirty = False
+        px = self._px
+
+        mask = np.isfinite(self._analog)
+        py = self._to_py(self._analog, self.analog_box, self.ylim)
+        self._set_polyline(self.poly_analog, px[mask], py[mask])
+
+        mask = np.isfinite(self._digital)
+        dx, dy = px[mask], self._to_py(self._digital[mask], self.digital_box, DIGITAL_YLIM)
+        # steps-post: hold each value until the next sample's column
+        self._set_polyline(self.poly_digital, np.repeat(dx, 2)[1:], np.repeat(dy, 2)[:-1])
+
+    def _set_polyline(self, item, xs, ys):
+        if len(xs) < 2:
+            self.widget.itemconfig(item, state="hidden")
+            return
+        coords = np.empty(2 * len(xs))
+        coords[0::2] = xs
+        coords[1::2] = ys
+        self.widget.coords(item, coords.tolist())
+        self.widget.itemconfig(item, state="normal")
+
+    # --- Static items ---
+    def schedule_redraw(self):
+        """Full redraw at the next Tk idle; repeated requests collapse into one."""
+        if self._redraw_id is None:
+            self._redraw_id = self.widget.after_idle(self.redraw)
+
+    def redraw(self):
+        """Rebuilds the static items (frames, grid, labels, limit lines) and the traces."""
+        self._redraw_id = None
+        canvas = self.widget
+        canvas.delete("static")
+        static = ("static",)
+
+        # --- Analog box ---
+        left, top, right, bottom = self.analog_box
+        low, high = self.ylim
+        for tick in nice_ticks(low, high):
+            y = self._to_py(tick, self.analog_box, self.ylim)
+            canvas.create_line(left, y, right, y, fill=GRID_COLOR, dash=(4, 2), tags=static)
+            canvas.create_text(left - 6, y, text="%g" % tick, anchor="e", font=self.font, tags=static)
+        for value, color, style in self.limit_lines.values():
+            if low <= value <= high:
+                y = self._to_py(value, self.analog_box, self.ylim)
+                canvas.create_line(left, y, right, y, fill=color, dash=LIMIT_DASHES[style], width=1.5, tags=static)
+        canvas.create_rectangle(left, top, right, bottom, outline="black", tags=static)
+        canvas.create_text((left + right) / 2, top - 4, text="Analog Signal (Temperature)",
+                           anchor="s", font=self.title_font, tags=static)
+
+        # --- Digital box ---
+        left, top, right, bottom = self.digital_box
+        for value, text in ((0, "OFF"), (1, "ON")):
+            y = self._to_py(value, self.digital_box, DIGITAL_YLIM)
+            canvas.create_line(left, y, right, y, fill=GRID_COLOR, tags=static)
+            canvas.create_text(left - 6, y, text=text, anchor="e", font=self.font, tags=static)
+        canvas.create_rectangle(left, top, right, bottom, outline="black", tags=static)
+        canvas.create_text((left + right) / 2, top - 4, text="Digital Output (Motor State)",
+                           anchor="s", font=self.title_font, tags=static)
+
+        # --- Shared time axis (labels under the digital box) ---
+        x0, x1 = self.x_grid[0], self.x_grid[-1]
+        for tick in nice_ticks(x0, x1):
+            x = left + (tick - x0) * ((right - left) / (x1 - x0 or 1.0))
+            canvas.create_text(x, bottom + 4, text=self.tick_formatter(tick), anchor="n",
+                               font=self.font, tags=static)
+
+        canvas.tag_lower("static")
+        self._dirty = True
+        self.update()
@@ -1,6 +1,20 @@
 import csv
 import os
-from datetime import datetime
+import queue
+import threading
+import time
+
+LOG_BUFFER_SIZE = 1 << 16   # Bytes buffered by the open log file before hitting the OS
+FLUSH_EVERY_ROWS = 64       # Rows written between explicit flushes to disk
+# One CSV line, formatted directly: the fields are numbers and the fixed status
+# messages, which never need quoting. Same line terminator as csv.writer.
+ROW_TEMPLATE = "%.2f,%s,%.4f,%d,%s\r\n"
+WRITE_QUEUE_SIZE = 1024     # Batches the writer thread may fall behind before dropping
+WRITE_DRAIN_LIMIT = 64      # Queued batches merged into one write by the writer thread
+CLOSE_TIMEOUT = 2.0         # Seconds close() waits on the writer (per step) before giving up
+
+_FLUSH = object()           # Queue marker: flush the file now
+_STOP = object()            # Queue marker: write everything queued, then exit
 
 class DataLogger:
     """
@@ -10,37 +24,133 @@ class DataLogger:
     def __init__(self, filename='data/process_history.csv'):
         self.filename = filename
         self.ensure_directory_exists()
+        # Kept open for the whole session instead of re-opening on every row;
+        # a 64 KiB buffer keeps writes in userspace until a batch fills it
+        self._file = open(self.filename, mode='a', newline='', buffering=LOG_BUFFER_SIZE)
         self.initialize_file()
+        self._pending = 0           # Rows written since the last flush
+        self._stamp_key = -1        # Epoch second of the cached date string
+        self._stamp_str = ""
+
+        # Disk writes happen on a daemon thread, so a slow filesystem never
+        # stalls the GUI; callers only enqueue finished text
+        self.dropped_rows = 0       # Rows discarded because the writer fell behind
+        self._queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
 
     def ensure_directory_exists(self):
         """Creates the 'data' directory if it doesn't exist."""
         directory = os.path.dirname(self.filename)
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
     def initialize_file(self):
-        """Checks if file exists; if not, creates it with headers."""
-        if not os.path.exists(self.filename):
-            with open(self.filename, mode='w', newline='') as file:
-                writer = csv.writer(file)
-                # Standard CSV Header
-                writer.writerow(["Timestamp", "Date_Time", "Analog_Value", "Digital_Value", "Status"])
+        """Writes the headers if the (just opened) file is empty."""
+        # Append mode starts at the end of the file, so position 0 means empty;
+        # no separate exists() check that could race with another writer
+        if self._file.tell() == 0:
+            writer = csv.writer(self._file)
+            # Standard CSV Header
+            writer.writerow(["Timestamp", "Date_Time", "Analog_Value", "Digital_Value", "Status"])
+
+    def format_row(self, timestamp, wall_time, analog_val, digital_val, status_msg):
+        """
+        Builds one CSV line. wall_time is the time.time() taken when the sample
+        was acquired, so rows formatted later keep their real acquisition time.
+        """
+        # The format has 1 s resolution, so strftime only runs when the epoch second changes
+        second = int(wall_time)
+        if second != self._stamp_key:
+            self._stamp_key = second
+            self._stamp_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        return ROW_TEMPLATE % (
+            timestamp,          # Simulation time (float)
+            self._stamp_str,    # Real wall-clock time
+            analog_val,         # Formatted precision
+            digital_val,        # 0 or 1
+            status_msg          # e.g., "NORMAL", "WARNING"
+        )
 
     def log_step(self, timestamp, analog_val, digital_val, status_msg):
         """
         Appends a single simulation step to the CSV file.
         """
-        current_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
+        self._enqueue(self.format_row(timestamp, time.time(), analog_val, digital_val, status_msg), 1)
+
+    def log_rows(self, rows):
+        """
+        Appends a batch of lines built with format_row() (written in a single call).
+        """
+        self._enqueue("".join(rows), len(rows))
+
+    def _enqueue(self, text, n_rows):
         try:
-            with open(self.filename, mode='a', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow([
-                    f"{timestamp:.2f}",  # Simulation time (float)
-                    current_time_str,    # Real wall-clock time
-                    f"{analog_val:.4f}", # Formatted precision
-                    int(digital_val),    # 0 or 1
-                    status_msg           # e.g., "NORMAL", "WARNING"
-                ])
+            self._queue.put_nowait((text, n_rows))
+        except queue.Full:
+            self.dropped_rows += n_rows   # Never block the GUI on a stuck disk
+
+    def _writer_loop(self):
+        """Writer thread: merges queued batches into single writes."""
+        while True:
+            item = self._queue.get()
+            chunks, n_rows = [], 0
+            # Merge whatever else is already waiting, up to a marker
+            while isinstance(item, tuple):
+                chunks.append(item[0])
+                n_rows += item[1]
+                if len(chunks) >= WRITE_DRAIN_LIMIT:
+                    item = None
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            if chunks:
+                self._write("".join(chunks), n_rows)
+            if item is _FLUSH:
+                self._flush_file()
+            elif item is _STOP:
+                self._flush_file()
+                return
+
+    def _write(self, text, n_rows):
+        try:
+            self._file.write(text)
+        except Exception as e:
+            print(f"[ERROR] Could not write to log file: {e}")
+            return
+        # Flushes once FLUSH_EVERY_ROWS rows have piled up since the last flush
+        self._pending += n_rows
+        if self._pending >= FLUSH_EVERY_ROWS:
+            self._flush_file()
+
+    def _flush_file(self):
+        try:
+            self._file.flush()
+            self._pending = 0
         except Exception as e:
-            print(f"[ERROR] Could not write to log file: {e}")
\ No newline at end of file
+            print(f"[ERROR] Could not write to log file: {e}")
+
+    def flush(self):
+        """Asks the writer thread to push everything queued so far to disk."""
+        try:
+            self._queue.put_nowait(_FLUSH)
+        except queue.Full:
+            pass    # The writer is behind the disk anyway; never block the GUI on it
+
+    def close(self):
+        """Writes out the queue and closes the log file (called when the application exits)."""
+        if self._file.closed:
+            return
+        # Bounded waits: a stuck disk must not hang the application on exit
+        try:
+            self._queue.put(_STOP, timeout=CLOSE_TIMEOUT)
+        except queue.Full:
+            pass
+        self._writer_thread.join(timeout=CLOSE_TIMEOUT)
+        if self._writer_thread.is_alive():
+            # The writer still owns the file; the OS closes it at exit
+            print("[ERROR] Log writer did not finish, the last rows may be lost.")
+            return
+        self._file.close()
@@ -0,0 +1,49 @@
+import numpy as np
+
+class HistoryBuffer:
+    """
+    Fixed-size ring buffer for the plotted channels.
+    All channels share one preallocated float64 array written at a moving head
+    index, so appending a sample is O(1) with no shifting. view() returns the
+    oldest-to-newest order (newest on the right) with NaN in the slots not
+    filled yet, matching the fixed x-grid of the plots.
+    """
+    def __init__(self, size, channels):
+        self.size = size
+        self.channels = {name: row for row, name in enumerate(channels)}
+        self._data = np.full((len(channels), size), np.nan, dtype=np.float64)
+        # Scratch rows the wrapped ring is unrolled into, so view() never allocates
+        self._unwrapped = np.empty_like(self._data)
+        self._head = 0    # Next slot to write (= oldest sample once full)
+        self._count = 0
+
+    def append(self, *values):
+        """Adds one sample per channel (in channel order), overwriting the oldest."""
+        self._data[:, self._head] = values
+        self._head = (self._head + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+
+    def view(self, name):
+        """
+        Full-width, oldest-to-newest row of a channel. The returned array is
+        reused: it is only valid until the next append/view of that channel.
+        """
+        index = self.channels[name]
+        row = self._data[index]
+        head = self._head
+        if head == 0:
+            return row   # Not wrapped: already in order, no copy
+        out = self._unwrapped[index]
+        tail = self.size - head
+        out[:tail] = row[head:]
+        out[tail:] = row[:head]
+        return out
+
+    def clear(self):
+        self._data.fill(np.nan)
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
@@ -0,0 +1,31 @@
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the kernels simply run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+from modules.signal_generator import LUT_SIZE, LUT_MASK
+
+@njit("Tuple((float64, int64, int64))(float64, float64[::1], float64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def scada_step(phase, table, offset, noise_sample, threshold, high_limit, low_limit):
+    """
+    Fused per-sample pipeline: waveform lookup, automatic motor logic and
+    alarm evaluation in a single call (compiled eagerly at import when numba
+    is present).
+    `phase` is the position inside the period in cycles (0..1), as kept by
+    SignalGenerator.advance_phase; the table is read with linear interpolation.
+    Returns (analog_value, digital_value, alarm_state_index), where the index
+    selects from modules.alarm_logic.ALARM_STATES.
+    """
+    position = phase * LUT_SIZE
+    index = int(position)
+    lower = table[index & LUT_MASK]
+    upper = table[(index + 1) & LUT_MASK]
+    analog_val = offset + lower + (position - index) * (upper - lower) + noise_sample
+    digital_val = 1 if analog_val > threshold else 0
+    state_index = int(analog_val >= high_limit) + 2 * int(analog_val <= low_limit)
+    return analog_val, digital_val, state_index
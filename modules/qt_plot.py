@@ -0,0 +1,122 @@
+from tkinter import ttk
+import numpy as np
+
+try:
+    import pyqtgraph as pg
+    from pyqtgraph.Qt import QtCore, QtWidgets
+except ImportError:
+    # pyqtgraph (plus a Qt binding) is optional: without it the
+    # "pyqtgraph" plot backend falls back to Matplotlib
+    pg = None
+
+QT_AVAILABLE = pg is not None
+QT_PUMP_MS = 20         # How often Tk lets Qt process its events while running
+QT_IDLE_PUMP_MS = 150   # Same while paused: the window must still move, repaint and close
+
+if QT_AVAILABLE:
+    LIMIT_PEN_STYLES = {"dashed": QtCore.Qt.PenStyle.DashLine, "dotted": QtCore.Qt.PenStyle.DotLine}
+
+    class TimeAxis(pg.AxisItem):
+        """Bottom axis whose labels come from the dashboard's time formatter."""
+        def __init__(self, formatter):
+            super().__init__(orientation="bottom")
+            self.formatter = formatter
+
+        def tickStrings(self, values, scale, spacing):
+            return [self.formatter(value) for value in values]
+
+class QtPlot:
+    """
+    pyqtgraph version of the graphs, shown in a separate Qt window next to the
+    Tk dashboard (same interface as CanvasPlot). Both toolkits share the main
+    thread: a Tk timer lets Qt process its events every QT_PUMP_MS while the
+    simulation runs and every QT_IDLE_PUMP_MS otherwise (set_running).
+    `widget` is a placeholder label in the Tk layout.
+    """
+    def __init__(self, parent, root, x_grid, tick_formatter):
+        self.widget = ttk.Label(parent, text="Graphs are shown in the pyqtgraph window.", anchor="center")
+        self.root = root
+        self.x_grid = x_grid
+        self._analog = self._digital = None
+        self._dirty = False
+        self._pump_ms = QT_IDLE_PUMP_MS
+        self.limit_lines = {}
+
+        self._qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.window = pg.GraphicsLayoutWidget(title="SCADA System - Graphs")
+        self.window.setBackground("w")
+        self.window.resize(900, 700)
+
+        self.plot_analog = self.window.addPlot(row=0, col=0, title="Analog Signal (Temperature)")
+        self.plot_analog.getAxis("bottom").setStyle(showValues=False)   # Time labels sit under the digital plot
+        self.plot_analog.setLabel("left", "Temperature (°C)")
+        self.plot_analog.showGrid(x=True, y=True, alpha=0.3)
+        self.time_axis = TimeAxis(tick_formatter)
+        self.plot_digital = self.window.addPlot(row=1, col=0, title="Digital Output (Motor State)",
+                                                axisItems={"bottom": self.time_axis})
+        self.plot_digital.setXLink(self.plot_analog)
+        self.plot_digital.getAxis("left").setTicks([[(0, "OFF"), (1, "ON")]])
+        self.plot_digital.setYRange(-0.5, 1.5, padding=0)
+        self.window.ci.layout.setRowStretchFactor(0, 3)   # 3:1 like the Matplotlib layout
+        self.plot_analog.setXRange(x_grid[0], x_grid[-1], padding=0)
+        for plot in (self.plot_analog, self.plot_digital):
+            plot.setMouseEnabled(x=False, y=False)
+
+        # connect="finite" leaves the NaN slots of a filling history undrawn
+        self.curve_analog = self.plot_analog.plot(pen=pg.mkPen("#007acc", width=2), connect="finite")
+        self.curve_digital = self.plot_digital.plot(pen=pg.mkPen("#2ca02c", width=3), connect="finite")
+        # steps-post x positions for the motor trace, fixed like the grid itself
+        self._step_x = np.repeat(x_grid, 2)[1:]
+
+        self.window.show()
+        self._pump()
+
+    def set_running(self, running):
+        """Switches Qt's event pump between the running and paused rates."""
+        self._pump_ms = QT_PUMP_MS if running else QT_IDLE_PUMP_MS
+
+    def _pump(self):
+        self._qt_app.processEvents()
+        self.root.after(self._pump_ms, self._pump)
+
+    def is_visible(self):
+        """False while the Qt window is closed or minimized."""
+        return self.window.isVisible() and not self.window.isMinimized()
+
+    # --- Data ---
+    def set_data(self, analog, digital):
+        """Stores the newest traces; update() pushes them to the curves."""
+        self._analog, self._digital = analog, digital
+        self._dirty = True
+
+    def set_ylim(self, low, high):
+        self.plot_analog.setYRange(low, high, padding=0)
+
+    def add_limit_line(self, name, value, color, style):
+        """Adds a constant horizontal line ("dashed" or "dotted") to the analog plot."""
+        line = pg.InfiniteLine(pos=value, angle=0, pen=pg.mkPen(color, width=1.5, style=LIMIT_PEN_STYLES[style]))
+        self.plot_analog.addItem(line)
+        self.limit_lines[name] = line
+
+    def move_limit_line(self, name, value):
+        self.limit_lines[name].setValue(value)
+
+    def update(self):
+        """Hands the stored traces to the curves (Qt repaints on its next pump)."""
+        if not self._dirty or self._analog is None:
+            return
+        self._dirty = False
+        self.curve_analog.setData(self.x_grid, self._analog)
+        self.curve_digital.setData(self._step_x, np.repeat(self._digital, 2)[:-1])
+
+    # --- Static items ---
+    def schedule_redraw(self):
+        """pyqtgraph repaints by itself; only the time labels need refreshing."""
+        self.redraw()
+
+    def redraw(self):
+        # Tick strings are cached with the axis picture, drop it to re-label
+        self.time_axis.picture = None
+        self.time_axis.update()
+        self._dirty = True
+        self.update()
@@ -1,57 +1,99 @@
 import numpy as np
 
+# Integer ids for the waveforms, resolved once in set_signal_type
+SINE_WAVE = 0
+SQUARE_WAVE = 1
+SAWTOOTH_WAVE = 2
+
+SIGNAL_TYPES = {
+    "Sine Wave": SINE_WAVE,
+    "Square Wave": SQUARE_WAVE,
+    "Sawtooth Wave": SAWTOOTH_WAVE,
+}
+
+# One waveform period is sampled into a lookup table. A power-of-two size lets
+# the phase wrap with a bit mask instead of a modulo.
+LUT_SIZE = 4096
+LUT_MASK = LUT_SIZE - 1
+
+NOISE_BLOCK_SIZE = 4096     # Unit-normal samples drawn per RNG call
+
+def build_waveform_table(signal_type_id, amplitude, size=LUT_SIZE):
+    """
+    Samples one period of the waveform (scaled by amplitude, centered on 0)
+    with vectorized NumPy. Unknown ids give a flat table.
+    """
+    phase = np.arange(size, dtype=np.float64) / size   # 0..1 within the period
+    if signal_type_id == SINE_WAVE:
+        # Standard sinusoidal wave
+        return amplitude * np.sin(2 * np.pi * phase)
+    elif signal_type_id == SQUARE_WAVE:
+        # Digital-like switching: +Amplitude or -Amplitude
+        return amplitude * np.sign(np.sin(2 * np.pi * phase))
+    elif signal_type_id == SAWTOOTH_WAVE:
+        # Linear rise from -Amplitude to +Amplitude
+        return 2 * amplitude * (phase - 0.5)
+    return np.zeros(size, dtype=np.float64)
+
 class SignalGenerator:
     """
     Handles math generation for signals.
-    Updated to be deterministic based on simulation time.
+    Holds the waveform table, the phase accumulator and the noise source that
+    the compiled simulation step (modules.kernels.scada_step) reads.
     """
     def __init__(self, amplitude=10, frequency=0.1, noise=0.5, offset=20.0):
         self.amplitude = amplitude
         self.frequency = frequency
         self.noise = noise
         self.offset = offset
-        self.signal_type = "Sine Wave"
+        self.phase = 0.0    # Position inside the current period, in cycles (0..1)
+        # Private Generator (no legacy global-state lock); unit-normal noise is
+        # drawn in blocks and scaled by self.noise when used, so changing the
+        # noise level never invalidates the block
+        self._rng = np.random.default_rng()
+        self._noise_block = self._rng.standard_normal(NOISE_BLOCK_SIZE)
+        self._noise_index = 0
+        self.set_signal_type("Sine Wave")
 
     def set_signal_type(self, new_type):
         """Sets the waveform type (Sine, Square, Sawtooth)."""
         self.signal_type = new_type
+        # Unknown names produce a flat signal at the offset
+        self.signal_type_id = SIGNAL_TYPES.get(new_type, -1)
+        self._rebuild_table()
+
+    def _rebuild_table(self):
+        """Resamples the waveform table; only runs on type/amplitude changes."""
+        self.table = build_waveform_table(self.signal_type_id, self.amplitude)
+
+    def sample_noise(self):
+        """One random noise sample for the analog signal."""
+        index = self._noise_index
+        if index == NOISE_BLOCK_SIZE:
+            self._noise_block = self._rng.standard_normal(NOISE_BLOCK_SIZE)
+            index = 0
+        self._noise_index = index + 1
+        return self._noise_block[index] * self.noise
     
-    def get_analog_value(self, current_time):
+    def advance_phase(self, dt):
         """
-        Calculates value based on the EXACT simulation time passed from main.py.
-        This fixes the 'jittery' or 'vertical line' look.
+        Moves the phase accumulator forward by one time step and returns it.
+        Accumulating (instead of frequency * time) keeps the waveform continuous
+        when the frequency slider moves.
         """
-        base_value = 0.0
-
-        # --- WAVEFORM SELECTION LOGIC ---
-        if self.signal_type == "Sine Wave":
-            # Standard sinusoidal wave
-            base_value = self.amplitude * np.sin(2 * np.pi * self.frequency * current_time)
-        elif self.signal_type == "Square Wave":
-            # Digital-like switching: +Amplitude or -Amplitude
-            sine_val = np.sin(2 * np.pi * self.frequency * current_time)
-            base_value = self.amplitude * np.sign(sine_val)
-        elif self.signal_type == "Sawtooth Wave":
-            # Linear rise from -Amplitude to +Amplitude
-            period = 1.0 / self.frequency if self.frequency > 0 else 1.0
-            # Normalize time to 0..1 within the period
-            fraction = (current_time % period) / period
-            # Scale to range [-Amplitude, +Amplitude]
-            base_value = 2 * self.amplitude * (fraction - 0.5)
-
-        final_value = self.offset + base_value
-        # Add random noise
-        random_noise = np.random.normal(0, self.noise)
-
-        return final_value + random_noise
-    
-    def get_digital_value(self, valoare_analogica, threshold=20.0):
-        """Returns 1 if analog value > threshold, else 0."""
-        return 1 if valoare_analogica > threshold else 0
+        self.phase = (self.phase + self.frequency * dt) % 1.0
+        return self.phase
+
+    def reset_phase(self):
+        """Rewinds the accumulator to the start of a period (system reset)."""
+        self.phase = 0.0
 
     def update_params(self, amp=None, freq=None):
         """Updates parameters dynamically."""
-        if amp is not None:
+        if amp is not None and amp != self.amplitude:
             self.amplitude = amp
+            self._rebuild_table()
         if freq is not None:
-            self.frequency = freq
\ No newline at end of file
+            # The table covers one period, so frequency only changes how fast
+            # advance_phase() moves through it
+            self.frequency = freq
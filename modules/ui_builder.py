@@ -1,7 +1,15 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
+import tkinter.font as tkfont
+import base64
+import io
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.ticker import FuncFormatter
+from matplotlib import font_manager
+from PIL import Image, ImageDraw, ImageFont   # Core Pillow is a Matplotlib dependency
+
+from modules.canvas_plot import CanvasPlot
 
 class UIBuilder:
     """
@@ -11,9 +19,56 @@ class UIBuilder:
     def __init__(self, app_instance, root):
         self.app = app_instance
         self.root = root
+        # "canvas" swaps the Matplotlib figure for the plain Tk CanvasPlot,
+        # "pyqtgraph" for a QtPlot window; both are driven through app.plot_canvas
+        self.plot_backend = self.app.config.get("plot_backend", "matplotlib")
+        if self.plot_backend == "pyqtgraph":
+            # Imported only for this backend: pyqtgraph and Qt add ~0.2 s to startup
+            from modules.qt_plot import QT_AVAILABLE
+            if not QT_AVAILABLE:
+                print("pyqtgraph is not installed. Using the matplotlib plot backend.")
+                self.plot_backend = "matplotlib"
+        self.fast_plot = self.plot_backend != "matplotlib"
+
+        # Named fonts are resolved once and shared by every widget using them
+        # (kept on self: a Font is deleted from Tk when garbage collected)
+        self.font_section = tkfont.Font(family="Arial", size=10, weight="bold")
+        self.font_caption = tkfont.Font(family="Arial", size=8)
+        self.font_motor = tkfont.Font(family="Arial", size=12, weight="bold")
+        self.font_status = tkfont.Font(family="Arial", size=14, weight="bold")
+        self.font_stat = tkfont.Font(family="Consolas", size=10)
+        self.font_stat_bold = tkfont.Font(family="Consolas", size=10, weight="bold")
+        self.font_value = tkfont.Font(family="Consolas", size=14)
+        self._configure_styles()
+
+        # Last state pushed to the HMI canvas items (skip no-op Tk calls)
+        self._hmi_options = {}
+        self._liquid_top_y = 128    # Pixel row of the liquid top (empty tank)
+
+    def _configure_styles(self):
+        """Registers the shared ttk label styles used by the control panel."""
+        style = ttk.Style(self.root)
+        style.configure("Section.TLabel", font=self.font_section)
+        style.configure("StatMax.TLabel", font=self.font_stat, foreground="red")
+        style.configure("StatMin.TLabel", font=self.font_stat, foreground="blue")
+        style.configure("StatAvg.TLabel", font=self.font_stat_bold)
+        style.configure("Value.TLabel", font=self.font_value)
+
+        # One style per status color: a state change swaps the style name
+        # instead of rewriting bg/fg on the label. Colors match ALARM_STATES.
+        self.status_styles = {}
+        for name, color in (("Idle", "gray"), ("Run", "#007acc"), ("Normal", "green"),
+                            ("Alarm", "red"), ("Warning", "orange")):
+            style_name = f"Status{name}.TLabel"
+            style.configure(style_name, background=color, foreground="white", font=self.font_status,
+                            anchor="center", padding=(0, 10))
+            self.status_styles[color] = style_name
 
     def build_all(self):
         """Constructs the entire UI layout."""
+        # Build while withdrawn: Tk settles the geometry once at the end
+        # instead of re-laying out the visible window after every widget
+        self.root.withdraw()
         main_layout = ttk.Frame(self.root)
         main_layout.pack(fill=tk.BOTH, expand=True)
 
@@ -21,18 +76,53 @@ class UIBuilder:
         self._build_control_panel(main_layout)
         
         # 2. Build Graphs Area (Right Side)
-        self._build_graphs(main_layout)
+        if self.plot_backend == "canvas":
+            self._build_graphs_fast(main_layout)
+        elif self.plot_backend == "pyqtgraph":
+            self._build_graphs_qt(main_layout)
+        else:
+            self._build_graphs(main_layout)
+
+        self.root.update_idletasks()
+        self.root.deiconify()
 
     def _build_control_panel(self, parent):
         control_panel = ttk.LabelFrame(parent, text="Control Panel", padding=15)
         control_panel.pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=10)
+        # StringVar labels by key, filled in by the sections that own them
+        self.app.label_vars = {}
+        # The panel is one grid column; _add_row() hands out the rows in order
+        self._panel_row = 0
+
+        # Everything is built here, while the window is still withdrawn: the
+        # HMI canvas and status label are the widest widgets in the panel, so
+        # adding them after the first paint would widen it and re-render the
+        # figure. The stats, HMI and status sections pack into their own frames.
+        self._build_controls_core(control_panel)
+        self._build_stats(self._add_section(control_panel))
+        self._build_parameters(control_panel)
+        self._build_hmi(self._add_section(control_panel))
+        self._build_status(self._add_section(control_panel))
+        control_panel.columnconfigure(0, weight=1)
+
+    def _add_row(self, widget, sticky="ew", pady=0):
+        """Grids a control panel widget on the next row (sticky="ew" fills the width)."""
+        widget.grid(row=self._panel_row, column=0, sticky=sticky, pady=pady)
+        self._panel_row += 1
 
+    def _add_section(self, control_panel):
+        """Grids a frame for one packed panel section on the next row."""
+        section = ttk.Frame(control_panel)
+        self._add_row(section)
+        return section
+
+    def _build_controls_core(self, control_panel):
         # --- Simulation Controls ---
         self.app.btn_start = ttk.Button(control_panel, text="START SIMULATION", command=self.app.toggle_simulation)
-        self.app.btn_start.pack(fill=tk.X, pady=10)
+        self._add_row(self.app.btn_start, pady=10)
         
         self.app.btn_reset = ttk.Button(control_panel, text="RESET SYSTEM", command=self.app.reset_simulation)
-        self.app.btn_reset.pack(fill=tk.X, pady=5)
+        self._add_row(self.app.btn_reset, pady=5)
         
         self.app.chk_log_var = tk.BooleanVar(value=False)
         self.app.chk_log = ttk.Checkbutton(
@@ -41,11 +131,11 @@ class UIBuilder:
             variable=self.app.chk_log_var, 
             command=self.app.toggle_logging
         )
-        self.app.chk_log.pack(fill=tk.X, pady=5)
+        self._add_row(self.app.chk_log, pady=5)
 
         # --- Manual Control Section ---
-        ttk.Separator(control_panel, orient='horizontal').pack(fill='x', pady=10)
-        ttk.Label(control_panel, text="Motor Control:", font=("Arial", 10, "bold")).pack(anchor="w")
+        self._add_row(ttk.Separator(control_panel, orient='horizontal'), pady=10)
+        self._add_row(ttk.Label(control_panel, text="Motor Control:", style="Section.TLabel"), sticky="w")
 
         self.app.chk_manual_var = tk.BooleanVar(value=False)
         self.app.chk_manual = ttk.Checkbutton(
@@ -54,7 +144,7 @@ class UIBuilder:
             variable=self.app.chk_manual_var,
             command=self.app.toggle_manual_ui
         )
-        self.app.chk_manual.pack(fill=tk.X, pady=2)
+        self._add_row(self.app.chk_manual, pady=2)
 
         self.app.btn_manual_toggle = tk.Button(
             control_panel, 
@@ -63,113 +153,310 @@ class UIBuilder:
             state="disabled",
             command=self.app.toggle_motor_manual
         )
-        self.app.btn_manual_toggle.pack(fill=tk.X, pady=5)
+        self._add_row(self.app.btn_manual_toggle, pady=5)
 
-        ttk.Separator(control_panel, orient='horizontal').pack(fill='x', pady=15)
+        self._add_row(ttk.Separator(control_panel, orient='horizontal'), pady=15)
 
+    def _build_stats(self, section):
         # --- Statistics ---
-        ttk.Label(control_panel, text="LIVE STATISTICS (Window):").pack(anchor="w")
-        stats_frame = ttk.Frame(control_panel)
+        ttk.Label(section, text="LIVE STATISTICS (Window):").pack(anchor="w")
+        stats_frame = ttk.Frame(section)
         stats_frame.pack(fill=tk.X, pady=5)
 
-        self.app.lbl_stat_max = ttk.Label(stats_frame, text="MAX: 0.00", font=("Consolas", 10), foreground="red")
+        # Per-frame text lives in StringVars (registered in app.label_vars);
+        # the dashboard writes them at a throttled rate, see set_label()
+        self.app.var_stat_max = tk.StringVar(value="MAX: 0.00")
+        self.app.var_stat_min = tk.StringVar(value="MIN: 0.00")
+        self.app.var_stat_avg = tk.StringVar(value="AVG: 0.00")
+        self.app.lbl_stat_max = ttk.Label(stats_frame, textvariable=self.app.var_stat_max, style="StatMax.TLabel")
         self.app.lbl_stat_max.pack(anchor="w")
-        self.app.lbl_stat_min = ttk.Label(stats_frame, text="MIN: 0.00", font=("Consolas", 10), foreground="blue")
+        self.app.lbl_stat_min = ttk.Label(stats_frame, textvariable=self.app.var_stat_min, style="StatMin.TLabel")
         self.app.lbl_stat_min.pack(anchor="w")
-        self.app.lbl_stat_avg = ttk.Label(stats_frame, text="AVG: 0.00", font=("Consolas", 10, "bold"))
+        self.app.lbl_stat_avg = ttk.Label(stats_frame, textvariable=self.app.var_stat_avg, style="StatAvg.TLabel")
         self.app.lbl_stat_avg.pack(anchor="w")
+        self.app.label_vars.update(stat_max=self.app.var_stat_max, stat_min=self.app.var_stat_min,
+                                   stat_avg=self.app.var_stat_avg)
 
+    def _build_parameters(self, control_panel):
         # --- Parameter Sliders ---
-        ttk.Label(control_panel, text="Signal Amplitude:").pack(anchor="w", pady=(10,0))
+        self._add_row(ttk.Label(control_panel, text="Signal Amplitude:"), sticky="w", pady=(10,0))
         self.app.slider_amp = ttk.Scale(control_panel, from_=0, to=40, orient=tk.HORIZONTAL, command=self.app.update_params)
         self.app.slider_amp.set(15)
-        self.app.slider_amp.pack(fill=tk.X, pady=5)
+        self._add_row(self.app.slider_amp, pady=5)
 
-        ttk.Label(control_panel, text="Process Frequency:").pack(anchor="w")
+        self._add_row(ttk.Label(control_panel, text="Process Frequency:"), sticky="w")
         self.app.slider_freq = ttk.Scale(control_panel, from_=0.01, to=0.5, orient=tk.HORIZONTAL, command=self.app.update_params)
         self.app.slider_freq.set(0.1)
-        self.app.slider_freq.pack(fill=tk.X, pady=5)
+        self._add_row(self.app.slider_freq, pady=5)
 
         # --- Signal Type Selector ---
-        ttk.Label(control_panel, text="Signal Type:").pack(anchor="w", pady=(10, 0))
+        self._add_row(ttk.Label(control_panel, text="Signal Type:"), sticky="w", pady=(10, 0))
         signal_options = ["Sine Wave", "Square Wave", "Sawtooth Wave"]
-        self.app.combo_type = ttk.Combobox(control_panel, values=signal_options, state="readonly")
-        self.app.combo_type.set("Sine Wave")
-        self.app.combo_type.pack(fill=tk.X, pady=5)
-        self.app.combo_type.bind("<<ComboboxSelected>>", self.app.change_signal_type)
+        # The selection lands in a StringVar whose write trace calls the app
+        # directly (no virtual event dispatch)
+        self.app.var_signal = tk.StringVar(value="Sine Wave")
+        self.app.combo_type = ttk.Combobox(control_panel, values=signal_options, state="readonly",
+                                           textvariable=self.app.var_signal)
+        self._add_row(self.app.combo_type, pady=5)
+        self.app.var_signal.trace_add("write", self.app.change_signal_type)
 
+    def _build_hmi(self, section):
         # --- HMI Visualization (Tank & Motor) ---
-        ttk.Separator(control_panel, orient='horizontal').pack(fill='x', pady=10)
-        ttk.Label(control_panel, text="PROCESS VISUALIZATION:", font=("Arial", 10, "bold")).pack(anchor="w")
+        ttk.Separator(section, orient='horizontal').pack(fill='x', pady=10)
+        ttk.Label(section, text="PROCESS VISUALIZATION:", style="Section.TLabel").pack(anchor="w")
 
-        self.app.canvas_hmi = tk.Canvas(control_panel, width=250, height=150, bg="white", highlightthickness=1, highlightbackground="#aaaaaa")
+        self.app.canvas_hmi = tk.Canvas(section, width=250, height=150, bg="white", highlightthickness=1, highlightbackground="#aaaaaa")
         self.app.canvas_hmi.pack(pady=5)
 
-        # Draw Static Elements
-        self.app.canvas_hmi.create_rectangle(30, 30, 90, 130, outline="black", width=3) 
-        self.app.canvas_hmi.create_text(60, 140, text="Tank", font=("Arial", 8))
-        
+        # Draw Static Elements: tank, pipe and captions are one pre-rendered
+        # image, so the canvas only tracks it plus the live items
+        self.hmi_background = self._render_hmi_background(250, 150)   # Keep a reference, Tk doesn't
+        self.app.canvas_hmi.create_image(0, 0, image=self.hmi_background, anchor="nw")
+
         # Draw Dynamic Liquid
+        # The liquid and motor items are created once and only ever mutated in
+        # place through set_liquid_level()/set_motor_state(), never recreated
         self.app.liquid_id = self.app.canvas_hmi.create_rectangle(32, 128, 88, 128, fill="#3498db", outline="")
 
-        # Draw Pipe
-        self.app.canvas_hmi.create_line(90, 100, 160, 100, width=4, fill="#555")
-
-        # Draw Dynamic Motor
+        # Draw Dynamic Motor (the "M" stays a live item: it sits on top of the oval)
         self.app.motor_id = self.app.canvas_hmi.create_oval(160, 75, 210, 125, fill="gray", outline="black", width=2)
-        self.app.canvas_hmi.create_text(185, 140, text="Motor", font=("Arial", 8))
-        self.app.canvas_hmi.create_text(185, 85, text="M", font=("Arial", 12, "bold"), fill="white")
+        self.app.canvas_hmi.create_text(185, 85, text="M", font=self.font_motor, fill="white")
+
+    def _render_hmi_background(self, width, height):
+        """Draws the static HMI chrome (tank outline, pipe, captions) into a PhotoImage."""
+        image = Image.new("RGB", (width, height), "white")
+        draw = ImageDraw.Draw(image)
+        # Matplotlib's bundled DejaVu Sans renders the same on every platform
+        caption_font = ImageFont.truetype(font_manager.findfont("DejaVu Sans"), 10)
 
-        ttk.Separator(control_panel, orient='horizontal').pack(fill='x', pady=15)
+        # Tank (PIL draws the outline inside the box, Tk centers it on the edge)
+        draw.rectangle((29, 29, 91, 131), outline="black", width=3)
+        draw.text((60, 140), "Tank", fill="black", font=caption_font, anchor="mm")
+        # Pipe
+        draw.line((90, 100, 160, 100), fill="#555555", width=4)
+        draw.text((185, 140), "Motor", fill="black", font=caption_font, anchor="mm")
+        # Handed to Tk as PNG (read natively by Tk 8.6), so Pillow's
+        # separately packaged ImageTk bridge isn't needed
+        png = io.BytesIO()
+        image.save(png, format="PNG")
+        return tk.PhotoImage(master=self.root, data=base64.b64encode(png.getvalue()), format="png")
 
+    def _build_status(self, section):
         # --- Status Labels ---
-        ttk.Label(control_panel, text="SYSTEM STATUS:").pack(anchor="w")
-        self.app.lbl_status = tk.Label(control_panel, text="IDLE", bg="gray", fg="white", font=("Arial", 14, "bold"), height=2, width=22)
+        ttk.Separator(section, orient='horizontal').pack(fill='x', pady=15)
+        ttk.Label(section, text="SYSTEM STATUS:").pack(anchor="w")
+        self.app.lbl_status = ttk.Label(section, text="IDLE", style="StatusIdle.TLabel", width=22)
         self.app.lbl_status.pack(fill=tk.X, pady=5)
 
-        self.app.lbl_val_analog = ttk.Label(control_panel, text="Temp: 0.00 °C", font=("Consolas", 14))
+        self.app.var_val_analog = tk.StringVar(value="Temp: 0.00 °C")
+        self.app.var_val_digital = tk.StringVar(value="Motor: OFF")
+        self.app.lbl_val_analog = ttk.Label(section, textvariable=self.app.var_val_analog, style="Value.TLabel")
         self.app.lbl_val_analog.pack(anchor="w", pady=10)
         
-        self.app.lbl_val_digital = ttk.Label(control_panel, text="Motor: OFF", font=("Consolas", 14))
+        self.app.lbl_val_digital = ttk.Label(section, textvariable=self.app.var_val_digital, style="Value.TLabel")
         self.app.lbl_val_digital.pack(anchor="w", pady=5)
 
+        self.app.label_vars.update(analog=self.app.var_val_analog, digital=self.app.var_val_digital)
+
     def _build_graphs(self, parent):
         graph_frame = ttk.Frame(parent)
         graph_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Matplotlib Figure Setup
-        self.app.fig, (self.app.ax1, self.app.ax2) = plt.subplots(2, 1, sharex=True, gridspec_kw={'height_ratios': [3, 1]})
-        self.app.fig.set_facecolor('#f0f0f0')
-        plt.subplots_adjust(bottom=0.1, right=0.95, top=0.95, hspace=0.3)
+        # One Axes; the motor state lives on a twin y-axis over the same plot area,
+        # so there is a single frame, x-axis and tick set to render
+        # A bare Figure (no pyplot): no global figure manager, no interactive
+        # mode, and the canvas below only draws when the app asks it to.
+        # 72 dpi: one point per pixel, so line widths and text rasterize to
+        # fewer pixels (the canvas still fills the widget)
+        self.app.fig = Figure(dpi=72, facecolor='#f0f0f0')
+        self.app.ax1 = self.app.fig.add_subplot()
+        self.app.ax2 = self.app.ax1.twinx()
+        self.app.fig.subplots_adjust(bottom=0.1, left=0.1, right=0.9, top=0.93)
 
         # --- Analog Plot ---
-        self.app.ax1.set_title("Analog Signal (Temperature)", fontsize=11, fontweight='bold')
+        self.app.ax1.set_title("Analog Signal (Temperature) & Motor State", fontsize=11, fontweight='bold')
         self.app.ax1.set_ylabel("Temperature (°C)")
-        self.app.ax1.grid(True, linestyle='--', alpha=0.7)
+        self.app.ax1.grid(True, linestyle='--', alpha=0.7, antialiased=False)
         
         # 1. Main Process Line
-        self.app.line_analog, = self.app.ax1.plot([], [], color='#007acc', lw=2.5, label='Process Value')
+        # Lines live on the fixed x-grid; per frame only their y data changes.
+        # animated=True keeps them out of full redraws: they are blitted on top.
+        history, x_grid = self.app.history, self.app.x_grid
+        self.app.line_analog, = self.app.ax1.plot(x_grid, history.view("analog"), color='#007acc', lw=2.5, label='Process Value', animated=True, antialiased=False, solid_joinstyle='miter')  # No AA coverage pass for the streaming line
         
         # 2. High Alarm Line (Red dashed)
-        self.app.line_alarm_limit, = self.app.ax1.plot([], [], color='red', linestyle='--', lw=1.5, label='High Alarm')
+        # Constant lines are axhlines: two points spanning the axes, drawn once
+        # as part of the blit background and never touched per frame
+        self.app.line_alarm_limit = self.app.ax1.axhline(self.app.alarm_system.high_limit, color='red', linestyle='--', lw=1.5, label='High Alarm')
         
         # 3. [NEW] Low Alarm Line (Orange dashed)
-        self.app.line_alarm_low, = self.app.ax1.plot([], [], color='#e67e22', linestyle='--', lw=1.5, label='Low Alarm')
+        self.app.line_alarm_low = self.app.ax1.axhline(self.app.alarm_system.low_limit, color='#e67e22', linestyle='--', lw=1.5, label='Low Alarm')
         
         # 4. [NEW] Baseline / Offset (Green dotted)
-        self.app.line_baseline, = self.app.ax1.plot([], [], color='green', linestyle=':', lw=1.0, alpha=0.8, label='Baseline (20°C)')
-
-        self.app.ax1.legend(loc='upper right', fontsize=8)
+        self.app.line_baseline = self.app.ax1.axhline(self.app.generator.offset, color='green', linestyle=':', lw=1.0, alpha=0.8, label='Baseline (20°C)')
 
-        # --- Digital Plot ---
-        self.app.ax2.set_title("Digital Output (Motor State)", fontsize=11, fontweight='bold')
-        self.app.ax2.set_ylabel("State (0/1)")
-        self.app.ax2.set_ylim(-0.5, 1.5) 
+        # --- Digital Plot (twin y-axis) ---
+        # The 0/1 range is stretched so the motor trace keeps to the lower band
+        # of the plot instead of crossing the temperature curve
+        self.app.ax2.set_ylabel("Motor State")
+        self.app.ax2.set_ylim(-0.25, 4.0)
         self.app.ax2.set_yticks([0, 1])
         self.app.ax2.set_yticklabels(['OFF', 'ON'])
-        self.app.ax2.grid(True, linestyle='-', alpha=0.5)
-        self.app.line_digital, = self.app.ax2.plot([], [], color='#2ca02c', lw=3, drawstyle='steps-post')
+        self.app.line_digital, = self.app.ax2.plot(x_grid, history.view("digital"), color='#2ca02c', lw=3, drawstyle='steps-post', antialiased=False, animated=True, label='Motor State')  # Axis-aligned steps gain nothing from AA
+
+        handles, labels = self.app.ax1.get_legend_handles_labels()
+        self.app.ax2.legend(handles + [self.app.line_digital], labels + ['Motor State'], loc='upper right', fontsize=8)
+
+        # Time axis: fixed span, tick labels translated to simulation time
+        self.app.ax1.set_xlim(x_grid[0], x_grid[-1])
+        self.app.ax1.xaxis.set_major_formatter(FuncFormatter(self.app.format_time_tick))
 
         # Canvas Embedding
         self.app.canvas = FigureCanvasTkAgg(self.app.fig, master=graph_frame)
-        self.app.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
\ No newline at end of file
+        self.app.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Every full redraw (startup, resize, rescale, reset) re-caches the
+        # line-free backgrounds, so a <Configure> resize re-primes by itself
+        self._backgrounds = {}
+        self.app.canvas.mpl_connect("draw_event", self._cache_backgrounds)
+
+    def _build_graphs_fast(self, parent):
+        """Same graphs as _build_graphs, drawn as Tk canvas items (no Agg rasterizing)."""
+        graph_frame = ttk.Frame(parent)
+        graph_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        self.app.plot_canvas = CanvasPlot(graph_frame, self.app.x_grid, self.app.format_time_tick,
+                                          font=self.font_caption, title_font=self.font_section)
+        self.app.plot_canvas.widget.pack(fill=tk.BOTH, expand=True)
+        self._add_limit_lines()
+
+    def _build_graphs_qt(self, parent):
+        """Same graphs as _build_graphs, in a pyqtgraph window beside the dashboard."""
+        from modules.qt_plot import QtPlot
+        self.app.plot_canvas = QtPlot(parent, self.root, self.app.x_grid, self.app.format_time_tick)
+        self.app.plot_canvas.widget.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._add_limit_lines()
+
+    def _add_limit_lines(self):
+        """Same constant lines as the Matplotlib figure, for the plot_canvas backends."""
+        plot = self.app.plot_canvas
+        plot.add_limit_line("high", self.app.alarm_system.high_limit, "red", "dashed")
+        plot.add_limit_line("low", self.app.alarm_system.low_limit, "#e67e22", "dashed")
+        plot.add_limit_line("baseline", self.app.generator.offset, "green", "dotted")
+
+    # --- Plot updates (both graph backends) ---
+    def plots_in_root(self):
+        """False when the graphs live in their own (Qt) window instead of the Tk root."""
+        return self.plot_backend != "pyqtgraph"
+
+    def plots_visible(self):
+        """False while the graphs are minimized or not mapped on screen."""
+        if not self.plots_in_root():
+            return self.app.plot_canvas.is_visible()
+        return self.root.state() != "iconic" and bool(self.plot_widget().winfo_viewable())
+
+    def plot_widget(self):
+        """The Tk widget showing the graphs."""
+        if self.fast_plot:
+            return self.app.plot_canvas.widget
+        return self.app.canvas.get_tk_widget()
+
+    def set_plot_data(self, analog, digital):
+        """Hands the newest traces to the plot; update_plots() shows them."""
+        if self.fast_plot:
+            self.app.plot_canvas.set_data(analog, digital)
+        else:
+            # x stays on the fixed grid, so only the y data is handed to Matplotlib
+            self.app.line_analog.set_ydata(analog)
+            self.app.line_digital.set_ydata(digital)
+
+    def set_analog_ylim(self, low, high):
+        """Changes the analog y-range (takes effect with the next full redraw)."""
+        if self.fast_plot:
+            self.app.plot_canvas.set_ylim(low, high)
+        else:
+            self.app.ax1.set_ylim(low, high)
+
+    def set_limit_lines(self, high, low):
+        """Moves the alarm limit lines (takes effect with the next full redraw)."""
+        if self.fast_plot:
+            self.app.plot_canvas.move_limit_line("high", high)
+            self.app.plot_canvas.move_limit_line("low", low)
+        else:
+            self.app.line_alarm_limit.set_ydata([high, high])
+            self.app.line_alarm_low.set_ydata([low, low])
+
+    # --- HMI updates ---
+    def set_motor_state(self, on):
+        """Colours the motor symbol for the running/stopped state."""
+        self._set_hmi_item("motor", self.app.motor_id, fill="#2ecc71" if on else "#95a5a6")
+
+    def set_liquid_level(self, level, color):
+        """Fills the tank to `level` (°C on its 0..40 scale) in the given colour."""
+        # Clamp to the 0..40 °C tank scale inline (no min/max builtin calls)
+        level = 0.0 if level < 0 else (40.0 if level > 40 else level)
+        # Whole pixels: the rectangle only moves when its top edge changes row
+        top_y = int(128 - level * (98 / 40.0))
+        if top_y != self._liquid_top_y:
+            self._liquid_top_y = top_y
+            self.app.canvas_hmi.coords(self.app.liquid_id, 32, top_y, 88, 128)
+        self._set_hmi_item("liquid", self.app.liquid_id, fill=color)
+
+    def _set_hmi_item(self, key, item_id, **options):
+        """itemconfig, skipped when the item already has these options."""
+        if self._hmi_options.get(key) != options:
+            self.app.canvas_hmi.itemconfig(item_id, **options)
+            self._hmi_options[key] = options
+
+    def set_plots_running(self, running):
+        """Switches the pyqtgraph window's event pump rate (the other backends need nothing)."""
+        if self.plot_backend == "pyqtgraph":
+            self.app.plot_canvas.set_running(running)
+
+    def animated_lines(self):
+        """(axes, lines) pairs repainted by blitting on every frame."""
+        # ax2 is a twin of ax1 (same bbox), so one background holds both lines
+        return (
+            (self.app.ax1, (self.app.line_analog, self.app.line_digital)),
+        )
+
+    def prime_blit(self):
+        """Full redraw of the figure; the draw_event handler caches the backgrounds."""
+        if self.fast_plot:
+            self.app.plot_canvas.redraw()
+            return
+        self.app.canvas.draw()
+
+    def schedule_redraw(self):
+        """
+        Requests a full redraw at the next Tk idle; bursts of requests
+        (rescale, threshold change, reset) collapse into one render.
+        """
+        if self.fast_plot:
+            self.app.plot_canvas.schedule_redraw()
+            return
+        self.app.canvas.draw_idle()
+
+    def _cache_backgrounds(self, event):
+        """After a full redraw, caches the line-free backgrounds and paints the lines."""
+        canvas = self.app.canvas
+        for ax, lines in self.animated_lines():
+            self._backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+            for line in lines:
+                ax.draw_artist(line)
+
+    def update_plots(self):
+        """Restores each cached background and pushes only the line pixels to Tk."""
+        if self.fast_plot:
+            self.app.plot_canvas.update()
+            return
+        canvas = self.app.canvas
+        for ax, lines in self.animated_lines():
+            background = self._backgrounds.get(ax)
+            if background is None:
+                continue
+            canvas.restore_region(background)
+            for line in lines:
+                ax.draw_artist(line)
+            canvas.blit(ax.bbox)
\ No newline at end of file
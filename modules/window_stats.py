@@ -0,0 +1,58 @@
+from collections import deque
+
+class WindowStats:
+    """
+    Sliding-window MAX / MIN / AVG over the last `size` samples.
+    Keeps a running sum and two monotonic deques, so every update is
+    amortized O(1) instead of rescanning the whole window each frame.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.reset()
+
+    def reset(self):
+        """Forgets every sample (used on system reset)."""
+        self._window = deque()
+        self._max_dq = deque()   # (index, value), values decreasing
+        self._min_dq = deque()   # (index, value), values increasing
+        self._sum = 0.0
+        self._index = 0
+
+    def push(self, value):
+        """Adds a sample, evicting the oldest one once the window is full."""
+        self._window.append(value)
+        self._sum += value
+        if len(self._window) > self.size:
+            self._sum -= self._window.popleft()
+
+        while self._max_dq and self._max_dq[-1][1] <= value:
+            self._max_dq.pop()
+        self._max_dq.append((self._index, value))
+
+        while self._min_dq and self._min_dq[-1][1] >= value:
+            self._min_dq.pop()
+        self._min_dq.append((self._index, value))
+
+        # Drop extremes that slid out of the window
+        oldest = self._index - self.size
+        if self._max_dq[0][0] <= oldest:
+            self._max_dq.popleft()
+        if self._min_dq[0][0] <= oldest:
+            self._min_dq.popleft()
+
+        self._index += 1
+
+    def __len__(self):
+        return len(self._window)
+
+    @property
+    def maximum(self):
+        return self._max_dq[0][1]
+
+    @property
+    def minimum(self):
+        return self._min_dq[0][1]
+
+    @property
+    def mean(self):
+        return self._sum / len(self._window)